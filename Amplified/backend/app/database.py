@@ -1,11 +1,19 @@
+import os
 from sqlmodel import SQLModel, create_engine, Session
+from sqlalchemy.pool import StaticPool
 from typing import Generator
 
 sqlite_file_name = "amplified.db"
-sqlite_url = f"sqlite:///{sqlite_file_name}"
+sqlite_url = os.getenv("DATABASE_URL", f"sqlite:///{sqlite_file_name}")
 
-connect_args = {"check_same_thread": False}
-engine = create_engine(sqlite_url, connect_args=connect_args)
+if sqlite_url in ("sqlite://", "sqlite:///:memory:"):
+    # An in-memory database lives on a single connection, so every session must share it
+    engine = create_engine(sqlite_url, connect_args={"check_same_thread": False}, poolclass=StaticPool)
+elif sqlite_url.startswith("sqlite"):
+    engine = create_engine(sqlite_url, connect_args={"check_same_thread": False})
+else:
+    # check_same_thread is a SQLite-only connect argument (e.g. PostgreSQL rejects it)
+    engine = create_engine(sqlite_url)
 
 def create_db_and_tables():
     # Import all models to ensure they're registered with SQLModel
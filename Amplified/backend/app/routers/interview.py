@@ -43,40 +43,7 @@ async def prepare_mock_interview(
             company_overview = research_service.perform_research(company_name)
             
         # 4. Research Role (Combine JD analysis with Role Research)
-        responsibilities = jd_analysis.get("key_responsibilities", [])
-        skills = jd_analysis.get("required_skills", [])
-        
-        if responsibilities or skills:
-            role_expectations = f"**{role}**\n\n"
-            if responsibilities:
-                role_expectations += f"**Key Responsibilities:**\n" + "\n".join([f"• {r}" for r in responsibilities])
-            if skills:
-                role_expectations += f"\n\n**Required Skills:**\n" + "\n".join([f"• {s}" for s in skills])
-        else:
-            # Fallback if analysis failed - provide helpful guidance
-            role_expectations = f"""**{role}**
-
-We couldn't automatically extract role details from the job description. This might happen if:
-• The JD link is behind a login/paywall
-• The page structure is unusual
-• The content is in an image or PDF
-
-**What to do:**
-1. **Review the original JD** and note the key responsibilities and required skills
-2. **Focus on these common areas** for a {role}:
-   • Test automation frameworks and tools
-   • CI/CD pipeline integration
-   • Test strategy and planning
-   • Cross-functional collaboration
-   • Quality metrics and reporting
-
-**Interview Prep Tips:**
-• Prepare examples from your experience that match the role's focus areas
-• Think about how your background aligns with typical {role.split()[0] if role.split() else 'senior'}-level expectations
-• Be ready to discuss your approach to test automation, quality processes, and team collaboration
-
-💡 **Remember:** Even without auto-extracted details, you can still have a great mock interview by focusing on core competencies for this role!"""
-        
+        role_expectations = _build_role_expectations(role, jd_analysis)
         
         # 5. Generate Potential Questions
         questions = await session_manager.llm_service.generate_mock_questions(
@@ -181,3 +148,51 @@ async def evaluate_mock_answer(
     except Exception as e:
         logger.error(f"Mock answer evaluation failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
+
+
+def _build_role_expectations(role: str, jd_analysis: dict) -> str:
+    """
+    Format the role expectations section of the mock interview briefing
+    
+    Args:
+        role: Role title entered by the user
+        jd_analysis: Result of JDAnalyzer.analyze_jd
+        
+    Returns:
+        Markdown listing responsibilities and skills, or guidance when none were extracted
+    """
+    responsibilities = jd_analysis.get("key_responsibilities", [])
+    skills = jd_analysis.get("required_skills", [])
+    
+    if responsibilities or skills:
+        role_expectations = f"**{role}**\n\n"
+        if responsibilities:
+            role_expectations += f"**Key Responsibilities:**\n" + "\n".join([f"• {r}" for r in responsibilities])
+        if skills:
+            role_expectations += f"\n\n**Required Skills:**\n" + "\n".join([f"• {s}" for s in skills])
+    else:
+        # Fallback if analysis failed - provide helpful guidance
+        role_expectations = f"""**{role}**
+
+We couldn't automatically extract role details from the job description. This might happen if:
+• The JD link is behind a login/paywall
+• The page structure is unusual
+• The content is in an image or PDF
+
+**What to do:**
+1. **Review the original JD** and note the key responsibilities and required skills
+2. **Focus on these common areas** for a {role}:
+   • Test automation frameworks and tools
+   • CI/CD pipeline integration
+   • Test strategy and planning
+   • Cross-functional collaboration
+   • Quality metrics and reporting
+
+**Interview Prep Tips:**
+• Prepare examples from your experience that match the role's focus areas
+• Think about how your background aligns with typical {role.split()[0] if role.split() else 'senior'}-level expectations
+• Be ready to discuss your approach to test automation, quality processes, and team collaboration
+
+💡 **Remember:** Even without auto-extracted details, you can still have a great mock interview by focusing on core competencies for this role!"""
+    
+    return role_expectations
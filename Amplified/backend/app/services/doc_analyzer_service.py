@@ -26,6 +26,13 @@ logger = structlog.get_logger(__name__)
 MAX_FILE_SIZE_BYTES = 10 * 1024 * 1024  # 10 MB
 MAX_PAGE_COUNT = 200
 
+# Keyword phrases used by the document type heuristic
+DOC_TYPE_KEYWORDS = {
+    DetectedDocType.BRD: ('business requirement', 'business case', 'stakeholder', 'roi', 'business objective'),
+    DetectedDocType.PRD: ('product requirement', 'user story', 'acceptance criteria', 'feature specification'),
+    DetectedDocType.DESIGN: ('architecture', 'technical design', 'system design', 'api specification', 'database schema'),
+}
+
 class DocumentAnalyzerService:
     def __init__(self):
         self.file_service = FileProcessingService()
@@ -115,23 +122,9 @@ class DocumentAnalyzerService:
         """
         text_lower = text.lower()
         
-        # Check for BRD indicators
-        brd_keywords = ['business requirement', 'business case', 'stakeholder', 'roi', 'business objective']
-        brd_score = sum(1 for kw in brd_keywords if kw in text_lower)
-        
-        # Check for PRD indicators
-        prd_keywords = ['product requirement', 'user story', 'acceptance criteria', 'feature specification']
-        prd_score = sum(1 for kw in prd_keywords if kw in text_lower)
-        
-        # Check for Design/Technical indicators
-        design_keywords = ['architecture', 'technical design', 'system design', 'api specification', 'database schema']
-        design_score = sum(1 for kw in design_keywords if kw in text_lower)
-        
-        # Determine type based on scores
         scores = {
-            DetectedDocType.BRD: brd_score,
-            DetectedDocType.PRD: prd_score,
-            DetectedDocType.DESIGN: design_score
+            doc_type: sum(1 for kw in keywords if kw in text_lower)
+            for doc_type, keywords in DOC_TYPE_KEYWORDS.items()
         }
         
         max_score = max(scores.values())
@@ -4,6 +4,7 @@ Export Service - Generate PDF and Markdown exports of analysis reports
 
 import structlog
 import json
+from io import BytesIO
 from typing import Dict, Any
 from datetime import datetime
 
@@ -183,6 +184,12 @@ class ExportService:
 """)
         return "\n".join(output)
     
+    def _load_pdf_libs(self):
+        """Import the optional PDF rendering libraries (raises ImportError if missing)"""
+        import markdown
+        from weasyprint import HTML, CSS
+        return markdown, HTML, CSS
+    
     def export_to_pdf(
         self,
         document_name: str,
@@ -206,9 +213,7 @@ class ExportService:
         
         try:
             # Try using markdown + weasyprint (if installed)
-            import markdown
-            from weasyprint import HTML, CSS
-            from io import BytesIO
+            markdown, HTML, CSS = self._load_pdf_libs()
             
             # Convert markdown to HTML
             html_content = markdown.markdown(
@@ -1,3 +1,4 @@
+import re
 import httpx
 import structlog
 from typing import Optional, Dict, Any
@@ -9,6 +10,9 @@ from app.services.encryption_service import EncryptionService
 
 logger = structlog.get_logger(__name__)
 
+# Jira issue key, e.g. PROJ-123
+TICKET_KEY_PATTERN = re.compile(r'[A-Z][A-Z0-9]+-\d+')
+
 class JiraService:
     def __init__(self):
         self.encryption_service = EncryptionService()
@@ -155,25 +159,23 @@ class JiraService:
         - Browse URLs: "https://domain.atlassian.net/browse/KAN-123"
         - Board URLs: Various board URL patterns
         """
-        import re
-        
         # Check if it's a URL
         if "http" in ticket_input:
             # Try to extract ticket key pattern (PROJECT-NUMBER)
-            match = re.search(r'([A-Z][A-Z0-9]+-\d+)', ticket_input)
+            match = TICKET_KEY_PATTERN.search(ticket_input)
             if match:
-                return match.group(1)
+                return match.group(0)
             
             # Fallback: try last segment
             segments = ticket_input.rstrip('/').split('/')
             for segment in reversed(segments):
-                if re.match(r'^[A-Z][A-Z0-9]+-\d+$', segment):
+                if TICKET_KEY_PATTERN.fullmatch(segment):
                     return segment
             
             raise ValueError(f"Could not extract ticket key from URL: {ticket_input}")
         
         # It's not a URL, validate it's a proper ticket key
-        if re.match(r'^[A-Z][A-Z0-9]+-\d+$', ticket_input.strip()):
+        if TICKET_KEY_PATTERN.fullmatch(ticket_input.strip()):
             return ticket_input.strip()
         
         raise ValueError(f"Invalid ticket key format: {ticket_input}. Expected format: PROJECT-123")
@@ -25,7 +25,8 @@ class MockInterviewService:
         """Store questions for the mock interview. user_id is for future multi-user support."""
         self.questions = questions
 
-    def get_question(self, index: int) -> str:
+    def get_question(self, index: int, user_id: str = "default") -> str:
+        """Return a stored question by index. user_id is for future multi-user support."""
         if 0 <= index < len(self.questions):
             return self.questions[index]
         return None
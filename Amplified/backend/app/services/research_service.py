@@ -4,6 +4,14 @@ from ddgs import DDGS
 
 logger = structlog.get_logger(__name__)
 
+# Heuristics for spotting the company name in JD text: "About X", "Join X", "Welcome to X", "at X we"
+COMPANY_NAME_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    r"About\s+([A-Z][a-z0-9]+(?:\s+[A-Z][a-z0-9]+)*)",
+    r"Join\s+([A-Z][a-z0-9]+(?:\s+[A-Z][a-z0-9]+)*)",
+    r"Welcome to\s+([A-Z][a-z0-9]+(?:\s+[A-Z][a-z0-9]+)*)",
+    r"at\s+([A-Z][a-z0-9]+(?:\s+[A-Z][a-z0-9]+)*)\s+we",
+))
+
 class ResearchService:
     def __init__(self):
         self.ddgs = DDGS()
@@ -13,15 +21,8 @@ class ResearchService:
         Attempts to extract the company name from the JD text using heuristics.
         """
         # Heuristic 1: Look for "About [Company]" or "Join [Company]"
-        patterns = [
-            r"About\s+([A-Z][a-z0-9]+(?:\s+[A-Z][a-z0-9]+)*)",
-            r"Join\s+([A-Z][a-z0-9]+(?:\s+[A-Z][a-z0-9]+)*)",
-            r"Welcome to\s+([A-Z][a-z0-9]+(?:\s+[A-Z][a-z0-9]+)*)",
-            r"at\s+([A-Z][a-z0-9]+(?:\s+[A-Z][a-z0-9]+)*)\s+we",
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, jd_text)
+        for pattern in COMPANY_NAME_PATTERNS:
+            match = pattern.search(jd_text)
             if match:
                 name = match.group(1).strip()
                 # Filter out common false positives
@@ -1,35 +1,64 @@
 import pytest
+import asyncio
+import json
 import os
 import sys
+from pathlib import Path
 from httpx import AsyncClient, ASGITransport
 from typing import AsyncGenerator, Generator
+from unittest.mock import AsyncMock
 from sqlmodel import Session, select, SQLModel
 
 # Add the backend directory to sys.path so we can import 'app'
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+# Run the suite against an in-memory SQLite database (set before the engine is created)
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
 from main import app
 from app.models import User
 from app.database import engine
 from app.services import auth_service
+from app.services.llm_router import llm_router
 import uuid
 
 @pytest.fixture(scope="session")
 def anyio_backend():
     return "asyncio"
 
+def pytest_asyncio_loop_factories(config, item):
+    """
+    Run async tests on uvloop when it is installed (it ships with uvicorn[standard]).
+    Its libuv-based loop has lower per-callback overhead than the default selector loop.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return {"asyncio": asyncio.new_event_loop}
+    return {"uvloop": uvloop.new_event_loop}
+
 @pytest.fixture(scope="session", autouse=True)
 def create_db_and_tables():
     SQLModel.metadata.create_all(engine)
 
+@pytest.fixture(scope="session")
+def test_user_email(worker_id: str) -> str:
+    """
+    Email for the auth test user, unique per pytest-xdist worker so parallel
+    workers don't race on the same row in the shared database.
+    """
+    if worker_id == "master":
+        return "test@example.com"
+    return f"test-{worker_id}@example.com"
+
 @pytest.fixture(scope="function")
-async def test_user() -> User:
+async def test_user(test_user_email: str) -> User:
     """
     Create a test user for authentication tests.
     """
     # Clean up any existing test user
     with Session(engine) as session:
-        statement = select(User).where(User.email == "test@example.com")
+        statement = select(User).where(User.email == test_user_email)
         existing_user = session.exec(statement).first()
         if existing_user:
             session.delete(existing_user)
@@ -39,7 +68,7 @@ async def test_user() -> User:
     with Session(engine) as session:
         user = User(
             id=str(uuid.uuid4()),
-            email="test@example.com",
+            email=test_user_email,
             name="Test User",
             password_hash=auth_service.get_password_hash("testpassword123")
         )
@@ -70,6 +99,36 @@ async def auth_token(test_user: User) -> str:
     token = auth_service.create_access_token(data={"sub": test_user.id})
     return token
 
+@pytest.fixture(scope="session")
+def session_user(create_db_and_tables, worker_id: str) -> User:
+    """
+    Test user shared across the session. Its tokens are minted directly, so no
+    password is ever hashed; the row only has to exist for get_current_user.
+    """
+    suffix = "" if worker_id == "master" else f"-{worker_id}"
+    email = f"session-user{suffix}@example.com"
+    with Session(engine) as session:
+        user = session.exec(select(User).where(User.email == email)).first()
+        if not user:
+            user = User(
+                id=str(uuid.uuid4()),
+                email=email,
+                name="Session Test User",
+                password_hash="!"
+            )
+            session.add(user)
+            session.commit()
+            session.refresh(user)
+        return user
+
+@pytest.fixture(scope="session")
+def auth_headers(session_user: User) -> dict:
+    """
+    Authorization headers for session_user, without a signup/login round-trip.
+    """
+    token = auth_service.create_access_token(data={"sub": session_user.id})
+    return {"Authorization": f"Bearer {token}"}
+
 @pytest.fixture(scope="function")
 async def client() -> AsyncGenerator[AsyncClient, None]:
     """
@@ -90,30 +149,50 @@ async def auth_client(auth_token: str) -> AsyncGenerator[AsyncClient, None]:
         yield ac
 
 @pytest.fixture(scope="function")
-def temp_file() -> Generator[str, None, None]:
+def fake_llm(monkeypatch):
+    """
+    Stub the shared LLM router so app-level tests never reach a provider.
+    Tests set return_value / side_effect on the router's generate_json and
+    generate_completion mocks.
+    """
+    monkeypatch.setattr(llm_router, "generate_json", AsyncMock(return_value={}))
+    monkeypatch.setattr(llm_router, "generate_completion", AsyncMock(return_value="Tell me about a recent project."))
+    return llm_router
+
+@pytest.fixture(scope="session")
+def llm_responses() -> dict:
+    """
+    Canned LLM payloads shared across test modules, keyed by use case.
+    Treat as read-only; it is loaded once per session.
+    """
+    return json.loads((Path(__file__).parent / "fixtures" / "llm_responses.json").read_text())
+
+@pytest.fixture(scope="function")
+def temp_file(tmp_path) -> Generator[str, None, None]:
     """
-    Creates a temporary file for upload tests and cleans it up afterwards.
+    Creates a temporary file for upload tests; tmp_path keeps it private to the test.
     """
-    filename = "test_upload_fixture.txt"
+    filename = str(tmp_path / "test_upload_fixture.txt")
     with open(filename, "w") as f:
         f.write("This is a dummy file content for testing. " * 10)
     
     yield filename
-    
-    if os.path.exists(filename):
-        os.remove(filename)
+
+@pytest.fixture(scope="session")
+def upload_file() -> tuple[str, bytes]:
+    """
+    In-memory upload payload as (filename, content), so tests skip the disk round-trip.
+    """
+    return "test_upload_fixture.txt", b"This is a dummy file content for testing. " * 10
 
 @pytest.fixture(scope="function")
-def temp_audio_file() -> Generator[str, None, None]:
+def temp_audio_file(tmp_path) -> Generator[str, None, None]:
     """
     Creates a temporary dummy audio file.
     """
-    filename = "test_audio_fixture.wav"
+    filename = str(tmp_path / "test_audio_fixture.wav")
     # Create a minimal valid WAV header or just dummy bytes if the backend doesn't validate strictly
     with open(filename, "wb") as f:
         f.write(b"RIFF\x24\x00\x00\x00WAVEfmt \x10\x00\x00\x00\x01\x00\x01\x00D\xac\x00\x00\x88X\x01\x00\x02\x00\x10\x00data\x00\x00\x00\x00")
     
     yield filename
-    
-    if os.path.exists(filename):
-        os.remove(filename)
@@ -9,23 +9,14 @@ from main import app
 
 client = TestClient(app)
 
-def test_update_action_status():
+def test_update_action_status(llm_responses):
     """
     Test updating the status of an action item.
     """
     # Mock the LLM router's generate_json method
     with patch("app.services.llm_service.llm_router.generate_json", new_callable=AsyncMock) as mock_generate:
         # Configure the mock to return a valid response
-        mock_generate.return_value = {
-            "short_summary": ["Action item created"],
-            "detailed_summary": "Discussion about tasks.",
-            "action_items": [
-                {
-                    "owner": "Speaker 1",
-                    "description": "Complete the task by tomorrow"
-                }
-            ]
-        }
+        mock_generate.return_value = llm_responses["meeting_summary"]
 
         # 1. Create User & Login
         signup_response = client.post(
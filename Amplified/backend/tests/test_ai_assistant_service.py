@@ -0,0 +1,189 @@
+"""
+Tests for AI Assistant Service
+Validates RAG question answering against a stubbed vector store and LLM
+"""
+
+import asyncio
+import contextlib
+import json
+import logging
+import os
+import statistics
+import time
+import pytest
+from unittest.mock import patch
+
+# Wall-clock budget for one answer_question call against the stubs (override in slow CI)
+ANSWER_BUDGET_S = float(os.getenv("ANSWER_BUDGET_S", "0.5"))
+# Timed calls per run; the budget applies to the p99 of these samples
+ITERS = max(2, int(os.getenv("ITERS", "100")))
+# Optional JSON-lines file the budget test appends its timings to, for trend tracking in CI
+PERF_RESULTS_PATH = os.getenv("PERF_RESULTS_PATH")
+
+# Keys every answer_question response carries
+EXPECTED_KEYS = frozenset(("answer", "sources", "confidence"))
+
+# Shape of VectorStoreService.search results
+SEARCH_RESULTS = [
+    {
+        "entity_id": "doc-1",
+        "entity_type": "document",
+        "content": "DQA (Data Quality Assurance) checks data for accuracy and completeness.",
+        "distance": 0.2,
+        "metadata": {"filename": "dqa.md"}
+    }
+]
+
+
+@contextlib.contextmanager
+def profiled():
+    """Profile the block with pyinstrument when PROFILE=1 (attributes await time per coroutine)"""
+    if os.getenv("PROFILE") != "1":
+        yield
+        return
+    pyinstrument = pytest.importorskip("pyinstrument")
+    with pyinstrument.Profiler(async_mode="enabled") as profiler:
+        yield
+    profiler.print(show_all=False)
+
+
+class TestAIAssistantService:
+    """Test suite for AIAssistantService"""
+    
+    @pytest.fixture(scope="module")
+    def _service_shell(self):
+        """Create one AIAssistantService with autospecced vector store and LLM service"""
+        from app.services.ai_assistant_service import AIAssistantService
+        
+        # autospec keeps the real method signatures, so a mismatched call fails the test
+        with patch("app.services.ai_assistant_service.VectorStoreService", autospec=True), \
+             patch("app.services.ai_assistant_service.LLMService", autospec=True):
+            return AIAssistantService()
+    
+    @pytest.fixture
+    def service(self, _service_shell):
+        """Hand out the shared service with fresh canned responses"""
+        _service_shell.vector_store.reset_mock()
+        _service_shell.llm_service.reset_mock()
+        _service_shell.vector_store.search.return_value = SEARCH_RESULTS
+        _service_shell.llm_service.generate_text.return_value = "According to Source 1, DQA is Data Quality Assurance."
+        return _service_shell
+    
+    @pytest.fixture
+    async def slow_callback_check(self):
+        """With ASYNCIO_DEBUG set, fail the test if a callback blocks the event loop for over 50ms"""
+        if not os.getenv("ASYNCIO_DEBUG"):
+            yield
+            return
+        loop = asyncio.get_running_loop()
+        debug, threshold = loop.get_debug(), loop.slow_callback_duration
+        loop.set_debug(True)
+        loop.slow_callback_duration = 0.05
+        # asyncio logs "Executing <Task ...> took N seconds" for each slow callback
+        slow = []
+        handler = logging.Handler(logging.WARNING)
+        handler.emit = lambda record: slow.append(record.getMessage())
+        asyncio_logger = logging.getLogger("asyncio")
+        asyncio_logger.addHandler(handler)
+        try:
+            yield
+        finally:
+            asyncio_logger.removeHandler(handler)
+            loop.set_debug(debug)
+            loop.slow_callback_duration = threshold
+        slow = [message for message in slow if " took " in message]
+        assert not slow, slow
+    
+    @pytest.fixture
+    def blocking_call_check(self):
+        """With BLOCKBUSTER=1, raise BlockingError on blocking I/O (sockets, time.sleep, file reads) inside coroutines"""
+        if os.getenv("BLOCKBUSTER") != "1":
+            yield
+            return
+        blockbuster = pytest.importorskip("blockbuster")
+        with blockbuster.blockbuster_ctx():
+            yield
+    
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("context_type", [None, "meeting", "document", "test_case"])
+    async def test_answer_question(self, service, slow_callback_check, blocking_call_check, context_type):
+        """Test answer_question calls the LLM service with a compatible signature"""
+        with profiled():
+            # A hanging downstream call surfaces as TimeoutError instead of stalling the run
+            result = await asyncio.wait_for(
+                service.answer_question(
+                    question="What is DQA?",
+                    user_id="test_user",
+                    context_type=context_type
+                ),
+                timeout=2.0
+            )
+        
+        missing = EXPECTED_KEYS - result.keys()
+        assert not missing, missing
+        # answer_question turns any exception (e.g. a TypeError) into confidence "error"
+        assert result["confidence"] != "error", result["answer"]
+        assert result["answer"] == "According to Source 1, DQA is Data Quality Assurance."
+        assert result["sources"][0]["id"] == "doc-1"
+        service.vector_store.search.assert_called_once_with(
+            query="What is DQA?", user_id="test_user", limit=10, entity_type=context_type
+        )
+        service.llm_service.generate_text.assert_awaited_once()
+    
+    @pytest.mark.perf
+    @pytest.mark.asyncio
+    async def test_answer_question_within_budget(self, service):
+        """Test answer_question overhead (prompt building, source formatting) stays within budget"""
+        # Throwaway call so one-off lazy initialisation isn't measured; wait_for fails fast on a hang
+        await asyncio.wait_for(
+            service.answer_question(question="warmup", user_id="warmup", context_type=None),
+            timeout=5
+        )
+        
+        timings = []
+        for _ in range(ITERS):
+            start = time.perf_counter()
+            result = await service.answer_question(
+                question="What is DQA?",
+                user_id="test_user",
+                context_type=None
+            )
+            timings.append(time.perf_counter() - start)
+            assert result["confidence"] != "error", result["answer"]
+        
+        median = statistics.median(timings)
+        p99 = statistics.quantiles(timings, n=100)[98]
+        if PERF_RESULTS_PATH:
+            record = {"case": "answer_question", "iters": ITERS, "median_s": median, "p99_s": p99, "budget_s": ANSWER_BUDGET_S}
+            with open(PERF_RESULTS_PATH, "a") as f:
+                f.write(json.dumps(record) + "\n")
+        assert p99 < ANSWER_BUDGET_S, (
+            f"answer_question p99 {p99:.4f}s (median {median:.4f}s over {ITERS} calls) "
+            f"exceeds budget {ANSWER_BUDGET_S}s"
+        )
+    
+    @pytest.mark.asyncio
+    async def test_answer_question_concurrently(self, service):
+        """Test concurrent answer_question calls don't interfere with each other"""
+        cases = [
+            ("What is DQA?", None),
+            ("Who owns the release checklist?", "meeting"),
+            ("Which tests cover login?", "test_case"),
+        ]
+        # TaskGroup waits for (or cancels) every call before the test moves on
+        async with asyncio.TaskGroup() as tg:
+            tasks = [
+                tg.create_task(service.answer_question(question=question, user_id=f"user-{i}", context_type=context_type))
+                for i, (question, context_type) in enumerate(cases)
+            ]
+        
+        for task in tasks:
+            result = task.result()
+            assert result["confidence"] != "error", result["answer"]
+            assert result["answer"] == "According to Source 1, DQA is Data Quality Assurance."
+        assert service.llm_service.generate_text.await_count == len(cases)
+        
+        # Each call searched with its own question, user and filter
+        searches = [call.kwargs for call in service.vector_store.search.call_args_list]
+        for i, (question, context_type) in enumerate(cases):
+            assert {"query": question, "user_id": f"user-{i}", "limit": 10, "entity_type": context_type} in searches
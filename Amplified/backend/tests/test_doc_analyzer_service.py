@@ -13,12 +13,18 @@ from app.models import (
     AnalyzedDocFileType, DetectedDocType
 )
 
+# Extracted text long enough to pass the 100-character minimum
+_VALID_TEXT = "This is a valid test document with sufficient length for analysis." * 5
+
+# 11 MB payload, allocated once; upload_document only checks its length
+_OVERSIZE_CONTENT = b"\x00" * (11 * 1024 * 1024)
+
 class TestDocumentAnalyzerService:
     """Test suite for DocumentAnalyzerService"""
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def service(self):
-        """Create service instance with mocked dependencies"""
+        """Create service instance with mocked dependencies (shared across the module)"""
         with patch("app.services.doc_analyzer_service.FileProcessingService") as mock_file_service_cls:
             service = DocumentAnalyzerService()
             # Create a mock instance
@@ -31,26 +37,54 @@ class TestDocumentAnalyzerService:
             service.file_service = mock_instance
             return service
 
-    @pytest.fixture
-    def mock_session(self):
-        """Mock database session"""
+    @pytest.fixture(autouse=True)
+    def reset_file_service(self, service):
+        """Clear extraction results configured by the previous test"""
+        yield
+        for method in (service.file_service.process_pdf, service.file_service.process_word, service.file_service.process_text):
+            method.reset_mock(return_value=True, side_effect=True)
+
+    @pytest.fixture(scope="module")
+    def session_cls(self):
+        """Patch the database Session class once for the whole module"""
         with patch("app.services.doc_analyzer_service.Session") as mock_session_cls:
-            session = mock_session_cls.return_value
-            session.__enter__.return_value = session
-            yield session
+            yield mock_session_cls
+
+    @pytest.fixture
+    def mock_session(self, session_cls):
+        """Mock database session, reset after each test"""
+        session = session_cls.return_value
+        session.__enter__.return_value = session
+        # reset_mock drops MagicMock's default, and a truthy __exit__ would swallow exceptions
+        session.__exit__.return_value = False
+        yield session
+        session.reset_mock(return_value=True, side_effect=True)
+
+    @pytest.fixture(scope="module")
+    def _upload_template(self):
+        """One UploadFile mock per module; building the spec from the class is the costly part"""
+        return AsyncMock(spec=UploadFile)
+
+    @pytest.fixture
+    def make_upload(self, _upload_template):
+        """Configure the shared UploadFile mock for a test (each test uses a single upload)"""
+        def _make(filename, content):
+            _upload_template.reset_mock(return_value=True, side_effect=True)
+            _upload_template.filename = filename
+            _upload_template.read.return_value = content
+            return _upload_template
+
+        return _make
 
     # --- Upload Tests ---
 
     @pytest.mark.asyncio
-    async def test_upload_document_success(self, service, mock_session):
+    async def test_upload_document_success(self, service, mock_session, make_upload):
         """Test successful document upload"""
-        # Mock file
-        mock_file = AsyncMock(spec=UploadFile)
-        mock_file.filename = "test.pdf"
-        mock_file.read.return_value = b"content"
+        mock_file = make_upload("test.pdf", b"content")
         
         # Mock text extraction
-        service.file_service.process_pdf.return_value = "This is a valid test document with sufficient length for analysis." * 5
+        service.file_service.process_pdf.return_value = _VALID_TEXT
         
         # Mock DB add
         def side_effect_add(obj):
@@ -66,36 +100,19 @@ class TestDocumentAnalyzerService:
         mock_session.commit.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_upload_document_size_limit(self, service):
-        """Test file size limit validation"""
-        mock_file = AsyncMock(spec=UploadFile)
-        mock_file.filename = "large.pdf"
-        # Mock 11MB content
-        mock_file.read.return_value = b"0" * (11 * 1024 * 1024)
-        
-        with pytest.raises(ValueError, match="exceeds limit"):
-            await service.upload_document(mock_file, "user1")
-
-    @pytest.mark.asyncio
-    async def test_upload_document_invalid_type(self, service):
-        """Test unsupported file type"""
-        mock_file = AsyncMock(spec=UploadFile)
-        mock_file.filename = "test.exe"
-        mock_file.read.return_value = b"content"
+    @pytest.mark.parametrize("filename,content,extracted_text,match", [
+        ("large.pdf", _OVERSIZE_CONTENT, None, "exceeds limit"),
+        ("test.exe", b"content", None, "Unsupported file type"),
+        ("empty.pdf", b"content", "", "Document appears to be empty"),
+    ], ids=["size_limit", "invalid_type", "empty_text"])
+    async def test_upload_document_rejected(self, service, make_upload, filename, content, extracted_text, match):
+        """Test upload validation: size limit, unsupported type, empty extracted text"""
+        mock_file = make_upload(filename, content)
         
-        with pytest.raises(ValueError, match="Unsupported file type"):
-            await service.upload_document(mock_file, "user1")
-
-    @pytest.mark.asyncio
-    async def test_upload_document_empty_text(self, service):
-        """Test empty extracted text validation"""
-        mock_file = AsyncMock(spec=UploadFile)
-        mock_file.filename = "empty.pdf"
-        mock_file.read.return_value = b"content"
+        if extracted_text is not None:
+            service.file_service.process_pdf.return_value = extracted_text
         
-        service.file_service.process_pdf.return_value = ""
-        
-        with pytest.raises(ValueError, match="Document appears to be empty"):
+        with pytest.raises(ValueError, match=match):
             await service.upload_document(mock_file, "user1")
 
     # --- Analysis Pipeline Tests ---
@@ -113,20 +130,21 @@ class TestDocumentAnalyzerService:
         mock_session.exec.return_value.first.return_value = mock_doc
         mock_session.get.return_value = mock_doc
         
-        # Mock analysis engines
-        # We patch the source module directly
-        with patch("app.services.analysis_engines.generate_structured_summary") as mock_summary, \
-             patch("app.services.analysis_engines.assess_risks") as mock_risks, \
-             patch("app.services.analysis_engines.detect_gaps_and_ambiguities") as mock_gaps, \
-             patch("app.services.analysis_engines.generate_qa_report") as mock_qa, \
+        # Mock analysis engines (the service calls them through the module attribute)
+        mock_summary = AsyncMock(return_value={"purpose": "Test"})
+        mock_risks = AsyncMock(return_value={"overall_risk_level": "Low"})
+        mock_gaps = AsyncMock(return_value={"gaps": []})
+        mock_qa = AsyncMock(return_value={"feature_summary": "Test"})
+        
+        with patch.multiple(
+                "app.services.analysis_engines",
+                generate_structured_summary=mock_summary,
+                assess_risks=mock_risks,
+                detect_gaps_and_ambiguities=mock_gaps,
+                generate_qa_report=mock_qa
+             ), \
              patch("app.services.llm_router.llm_router") as mock_router:
             
-            # Configure async mocks
-            mock_summary.side_effect = AsyncMock(return_value={"purpose": "Test"})
-            mock_risks.side_effect = AsyncMock(return_value={"overall_risk_level": "Low"})
-            mock_gaps.side_effect = AsyncMock(return_value={"gaps": []})
-            mock_qa.side_effect = AsyncMock(return_value={"feature_summary": "Test"})
-            
             mock_router.get_user_engine.return_value = "gpt-4"
             
             result = await service.analyze_document("doc_123", "user1")
@@ -162,7 +180,7 @@ class TestDocumentAnalyzerService:
         mock_session.exec.return_value.first.return_value = mock_doc
         mock_session.get.return_value = mock_doc
         
-        with patch("app.services.analysis_engines.generate_structured_summary") as mock_summary:
+        with patch("app.services.analysis_engines.generate_structured_summary", new_callable=AsyncMock) as mock_summary:
             # Simulate error in first stage
             mock_summary.side_effect = Exception("Analysis Error")
             
@@ -209,7 +227,3 @@ class TestDocumentAnalyzerService:
         assert service._detect_document_type("user story acceptance criteria") == DetectedDocType.PRD
         assert service._detect_document_type("api specification database schema") == DetectedDocType.DESIGN
         assert service._detect_document_type("random text content") == DetectedDocType.UNKNOWN
-
-
-if __name__ == "__main__":
-    pytest.main([__file__, "-v"])
@@ -1,34 +1,34 @@
 import pytest
 from httpx import AsyncClient
-import os
+from io import BytesIO
 
 @pytest.mark.asyncio
-async def test_upload_document(auth_client: AsyncClient, temp_file: str):
+async def test_upload_document(auth_client: AsyncClient, upload_file: tuple[str, bytes]):
     """
     Test uploading a valid document.
     """
-    with open(temp_file, "rb") as f:
-        files = {"file": (os.path.basename(temp_file), f, "text/plain")}
-        data = {"type": "spec", "tags": "test_tag"}
-        response = await auth_client.post("/documents", files=files, data=data)
+    filename, content = upload_file
+    files = {"file": (filename, BytesIO(content), "text/plain")}
+    data = {"type": "spec", "tags": "test_tag"}
+    response = await auth_client.post("/documents", files=files, data=data)
     
     assert response.status_code == 200
     res_data = response.json()
     assert "id" in res_data
-    assert res_data["name"] == os.path.basename(temp_file)
+    assert res_data["name"] == filename
     
     # Store ID for cleanup/search test if we were chaining, 
     # but tests should be independent. We'll rely on the service logic.
 
 @pytest.mark.asyncio
-async def test_upload_document_missing_type(auth_client: AsyncClient, temp_file: str):
+async def test_upload_document_missing_type(auth_client: AsyncClient, upload_file: tuple[str, bytes]):
     """
     Test uploading without the required 'type' field.
     """
-    with open(temp_file, "rb") as f:
-        files = {"file": (os.path.basename(temp_file), f, "text/plain")}
-        # Missing 'type' in data
-        response = await auth_client.post("/documents", files=files, data={})
+    filename, content = upload_file
+    files = {"file": (filename, BytesIO(content), "text/plain")}
+    # Missing 'type' in data
+    response = await auth_client.post("/documents", files=files, data={})
     
     # FastAPI should return 422 Unprocessable Entity for missing Form field
     assert response.status_code == 422
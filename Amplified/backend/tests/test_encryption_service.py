@@ -3,8 +3,7 @@ Tests for Encryption Service
 Validates encryption/decryption functionality for securing sensitive data like Jira API tokens
 """
 
-import pytest
-import os
+import asyncio
 from app.services.encryption_service import EncryptionService
 from cryptography.fernet import Fernet
 
@@ -33,7 +32,7 @@ class TestEncryptionService:
         
         assert decrypted == original_data
     
-    def test_encryption_decryption_round_trip(self):
+    async def test_encryption_decryption_round_trip(self):
         """Test encryption followed by decryption returns original data"""
         service = EncryptionService()
         test_data = [
@@ -45,10 +44,13 @@ class TestEncryptionService:
             "unicode_token_测试"
         ]
         
-        for data in test_data:
+        def round_trip(data):
             encrypted = service.encrypt(data)
             decrypted = service.decrypt(encrypted)
             assert decrypted == data, f"Round trip failed for: {data}"
+        
+        # Fernet does its crypto inside OpenSSL, so round trips overlap in threads
+        await asyncio.gather(*(asyncio.to_thread(round_trip, data) for data in test_data))
     
     def test_empty_string_encryption(self):
         """Test encrypting empty string returns empty string"""
@@ -79,79 +81,59 @@ class TestEncryptionService:
             decrypted = service.decrypt(token)
             assert decrypted == "", f"Expected empty string for invalid token: {token}"
     
-    def test_encryption_key_from_environment(self):
+    def test_encryption_key_from_environment(self, monkeypatch):
         """Test service uses ENCRYPTION_KEY from environment if provided"""
         # Generate a valid Fernet key
         test_key = Fernet.generate_key().decode()
+        monkeypatch.setenv("ENCRYPTION_KEY", test_key)
         
-        # Set environment variable
-        os.environ["ENCRYPTION_KEY"] = test_key
-        
-        try:
-            service = EncryptionService()
-            
-            # Verify the key was used
-            assert service.key.decode() == test_key
-            
-            # Verify encryption/decryption works
-            original_data = "test_data"
-            encrypted = service.encrypt(original_data)
-            decrypted = service.decrypt(encrypted)
-            assert decrypted == original_data
-        finally:
-            # Clean up environment variable
-            del os.environ["ENCRYPTION_KEY"]
+        service = EncryptionService()
+        
+        # Verify the key was used
+        assert service.key.decode() == test_key
+        
+        # Verify encryption/decryption works
+        original_data = "test_data"
+        encrypted = service.encrypt(original_data)
+        decrypted = service.decrypt(encrypted)
+        assert decrypted == original_data
     
-    def test_encryption_key_generation_when_missing(self):
+    def test_encryption_key_generation_when_missing(self, monkeypatch):
         """Test service generates a key when ENCRYPTION_KEY is not in environment"""
-        # Ensure ENCRYPTION_KEY is not set
-        if "ENCRYPTION_KEY" in os.environ:
-            original_key = os.environ["ENCRYPTION_KEY"]
-            del os.environ["ENCRYPTION_KEY"]
-        else:
-            original_key = None
-        
-        try:
-            service = EncryptionService()
-            
-            # Verify a key was generated
-            assert service.key is not None
-            assert isinstance(service.key, bytes)
-            assert len(service.key) > 0
-            
-            # Verify encryption/decryption works with generated key
-            original_data = "test_data"
-            encrypted = service.encrypt(original_data)
-            decrypted = service.decrypt(encrypted)
-            assert decrypted == original_data
-        finally:
-            # Restore original environment state
-            if original_key:
-                os.environ["ENCRYPTION_KEY"] = original_key
+        monkeypatch.delenv("ENCRYPTION_KEY", raising=False)
+        
+        service = EncryptionService()
+        
+        # Verify a key was generated
+        assert service.key is not None
+        assert isinstance(service.key, bytes)
+        assert len(service.key) > 0
+        
+        # Verify encryption/decryption works with generated key
+        original_data = "test_data"
+        encrypted = service.encrypt(original_data)
+        decrypted = service.decrypt(encrypted)
+        assert decrypted == original_data
     
-    def test_different_instances_with_same_key(self):
+    def test_different_instances_with_same_key(self, monkeypatch):
         """Test two instances with same key can decrypt each other's data"""
         # Set a specific key
         test_key = Fernet.generate_key().decode()
-        os.environ["ENCRYPTION_KEY"] = test_key
-        
-        try:
-            service1 = EncryptionService()
-            service2 = EncryptionService()
-            
-            original_data = "shared_secret"
-            encrypted = service1.encrypt(original_data)
-            decrypted = service2.decrypt(encrypted)
-            
-            assert decrypted == original_data
-        finally:
-            del os.environ["ENCRYPTION_KEY"]
+        monkeypatch.setenv("ENCRYPTION_KEY", test_key)
+        
+        service1 = EncryptionService()
+        service2 = EncryptionService()
+        
+        original_data = "shared_secret"
+        encrypted = service1.encrypt(original_data)
+        decrypted = service2.decrypt(encrypted)
+        
+        assert decrypted == original_data
     
-    def test_different_instances_different_keys_cannot_decrypt(self):
+    def test_different_instances_different_keys_cannot_decrypt(self, monkeypatch):
         """Test instances with different keys cannot decrypt each other's data"""
         # First instance with its own key
-        if "ENCRYPTION_KEY" in os.environ:
-            del os.environ["ENCRYPTION_KEY"]
+        monkeypatch.delenv("ENCRYPTION_KEY", raising=False)
         
         service1 = EncryptionService()
         original_data = "secret_data"
@@ -163,7 +145,3 @@ class TestEncryptionService:
         
         # Decryption should fail and return empty string
         assert decrypted == ""
-
-
-if __name__ == "__main__":
-    pytest.main([__file__, "-v"])
@@ -5,11 +5,104 @@ Validates Markdown and PDF export functionality
 
 import pytest
 import json
-from unittest.mock import MagicMock, patch, Mock
+import re
+from unittest.mock import MagicMock, patch
 import sys
 from app.services.export_service import ExportService
 
 
+# Serialized once at import; the export tests only read from it
+_SAMPLE_ANALYSIS = {
+    "structured_summary": json.dumps({
+        "purpose": "Test Purpose",
+        "scope_in": ["Feature A", "Feature B"],
+        "scope_out": ["Feature C"],
+        "key_features": ["Login", "Dashboard"],
+        "constraints": ["Time", "Budget"],
+        "assumptions": ["User is admin"],
+        "stakeholders": ["Client", "Team"]
+    }),
+    "risk_assessment": json.dumps({
+        "risks": [
+            {
+                "title": "Data Loss",
+                "category": "Security",
+                "likelihood": "Low",
+                "impact": "High",
+                "description": "DB crash",
+                "mitigation": "Backups"
+            }
+        ]
+    }),
+    "gaps_and_questions": json.dumps({
+        "gaps": [
+            {
+                "description": "Missing Auth",
+                "impact": "High",
+                "questions": ["How to login?"]
+            }
+        ]
+    }),
+    "qa_report": json.dumps({
+        "feature_summary": "Good coverage",
+        "recommended_test_types": ["Unit", "Integration"],
+        "test_ideas": [
+            {
+                "area": "Auth",
+                "test_cases": ["Valid login", "Invalid login"]
+            }
+        ],
+        "high_risk_scenarios": ["Concurrent users"],
+        "open_questions": ["Timeline?"]
+    }),
+    "overall_risk_level": "Medium",
+    "model_version": "GPT-4",
+    "created_at": "2023-01-01"
+}
+
+
+# Sections and content expected in the markdown export of _SAMPLE_ANALYSIS
+_MARKDOWN_NEEDLES = (
+    "# Document Quality Analysis Report",
+    "**Document:** test_doc.pdf",
+    "## 📋 Structured Summary",
+    "## ⚠️ Risk Assessment",
+    "## 🔍 Gaps & Questions",
+    "## ✅ QA Report",
+    "Test Purpose",
+    "- Feature A",
+    "Data Loss",
+    "Missing Auth",
+    "Valid login",
+)
+_MARKDOWN_NEEDLES_RE = re.compile("|".join(map(re.escape, _MARKDOWN_NEEDLES)))
+
+
+class _FakeMarkdown:
+    """Stand-in for the markdown module"""
+    def __init__(self):
+        self.calls = 0
+
+    def markdown(self, text, **kwargs):
+        self.calls += 1
+        return "<html>Content</html>"
+
+
+class _FakeHTML:
+    """Stand-in for weasyprint.HTML"""
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def write_pdf(self, target):
+        target.write(b"PDF CONTENT")
+
+
+class _FakeCSS:
+    """Stand-in for weasyprint.CSS"""
+    def __init__(self, *args, **kwargs):
+        pass
+
+
 class TestExportService:
     """Test suite for ExportService"""
     
@@ -21,53 +114,7 @@ class TestExportService:
     @pytest.fixture
     def sample_analysis_data(self):
         """Create sample analysis data"""
-        return {
-            "structured_summary": json.dumps({
-                "purpose": "Test Purpose",
-                "scope_in": ["Feature A", "Feature B"],
-                "scope_out": ["Feature C"],
-                "key_features": ["Login", "Dashboard"],
-                "constraints": ["Time", "Budget"],
-                "assumptions": ["User is admin"],
-                "stakeholders": ["Client", "Team"]
-            }),
-            "risk_assessment": json.dumps({
-                "risks": [
-                    {
-                        "title": "Data Loss",
-                        "category": "Security",
-                        "likelihood": "Low",
-                        "impact": "High",
-                        "description": "DB crash",
-                        "mitigation": "Backups"
-                    }
-                ]
-            }),
-            "gaps_and_questions": json.dumps({
-                "gaps": [
-                    {
-                        "description": "Missing Auth",
-                        "impact": "High",
-                        "questions": ["How to login?"]
-                    }
-                ]
-            }),
-            "qa_report": json.dumps({
-                "feature_summary": "Good coverage",
-                "recommended_test_types": ["Unit", "Integration"],
-                "test_ideas": [
-                    {
-                        "area": "Auth",
-                        "test_cases": ["Valid login", "Invalid login"]
-                    }
-                ],
-                "high_risk_scenarios": ["Concurrent users"],
-                "open_questions": ["Timeline?"]
-            }),
-            "overall_risk_level": "Medium",
-            "model_version": "GPT-4",
-            "created_at": "2023-01-01"
-        }
+        return _SAMPLE_ANALYSIS
 
     # --- Markdown Export Tests ---
 
@@ -75,19 +122,8 @@ class TestExportService:
         """Test markdown export contains key sections"""
         md = service.export_to_markdown("test_doc.pdf", sample_analysis_data)
         
-        assert "# Document Quality Analysis Report" in md
-        assert "**Document:** test_doc.pdf" in md
-        assert "## 📋 Structured Summary" in md
-        assert "## ⚠️ Risk Assessment" in md
-        assert "## 🔍 Gaps & Questions" in md
-        assert "## ✅ QA Report" in md
-        
-        # Check content
-        assert "Test Purpose" in md
-        assert "- Feature A" in md
-        assert "Data Loss" in md
-        assert "Missing Auth" in md
-        assert "Valid login" in md
+        found = set(_MARKDOWN_NEEDLES_RE.findall(md))
+        assert found == set(_MARKDOWN_NEEDLES), f"Missing sections/content: {set(_MARKDOWN_NEEDLES) - found}"
 
     def test_export_to_markdown_empty(self, service):
         """Test markdown export with empty data"""
@@ -140,43 +176,32 @@ class TestExportService:
 
     # --- PDF Export Tests ---
 
-    def test_export_to_pdf_success(self, service, sample_analysis_data):
-        """Test successful PDF export with mocked libraries"""
-        # Mock markdown and weasyprint
-        mock_markdown = MagicMock()
-        mock_markdown.markdown.return_value = "<html>Content</html>"
+    def test_export_to_pdf_success(self, service, sample_analysis_data, monkeypatch):
+        """Test successful PDF export with stubbed libraries"""
+        fake_markdown = _FakeMarkdown()
+        html_docs = []
+
+        def fake_html(*args, **kwargs):
+            html_docs.append(_FakeHTML(*args, **kwargs))
+            return html_docs[-1]
+
+        monkeypatch.setattr(service, "_load_pdf_libs", lambda: (fake_markdown, fake_html, _FakeCSS))
         
-        mock_html_cls = MagicMock()
-        mock_html_instance = mock_html_cls.return_value
-        mock_html_instance.write_pdf.side_effect = lambda f: f.write(b"PDF CONTENT")
+        pdf_bytes = service.export_to_pdf("test.pdf", sample_analysis_data)
         
-        with patch.dict(sys.modules, {
-            'markdown': mock_markdown,
-            'weasyprint': MagicMock(HTML=mock_html_cls, CSS=MagicMock())
-        }):
-            pdf_bytes = service.export_to_pdf("test.pdf", sample_analysis_data)
-            
-            assert pdf_bytes == b"PDF CONTENT"
-            mock_markdown.markdown.assert_called_once()
-            mock_html_cls.assert_called_once()
+        assert pdf_bytes == b"PDF CONTENT"
+        assert fake_markdown.calls == 1
+        assert len(html_docs) == 1
 
-    def test_export_to_pdf_import_error(self, service, sample_analysis_data):
+    def test_export_to_pdf_import_error(self, service, sample_analysis_data, monkeypatch):
         """Test PDF export raises NotImplementedError when libraries missing"""
-        # Mock missing weasyprint
-        with patch.dict(sys.modules, {'weasyprint': None}):
-            # We need to ensure import raises ImportError
-            # Since we can't easily unimport, we'll patch the import inside the method
-            # But the method does 'import markdown' and 'from weasyprint import HTML'
-            # The easiest way is to mock the built-in __import__ but that's risky.
-            # Instead, we can rely on the fact that if we set sys.modules['weasyprint'] to None, 
-            # subsequent imports might fail or we can patch the method logic if needed.
-            # Actually, let's just patch the imports by wrapping the function execution 
-            # in a context where imports fail.
-            
-            # A better approach for testing ImportError inside a function:
-            with patch('builtins.__import__', side_effect=ImportError("No module named weasyprint")):
-                with pytest.raises(NotImplementedError, match="PDF export requires 'weasyprint'"):
-                    service.export_to_pdf("test.pdf", sample_analysis_data)
+        def missing_libs():
+            raise ImportError("No module named weasyprint")
+        
+        monkeypatch.setattr(service, "_load_pdf_libs", missing_libs)
+        
+        with pytest.raises(NotImplementedError, match="PDF export requires 'weasyprint'"):
+            service.export_to_pdf("test.pdf", sample_analysis_data)
 
     def test_export_to_pdf_general_error(self, service, sample_analysis_data):
         """Test PDF export handles general errors"""
@@ -189,7 +214,3 @@ class TestExportService:
         }):
             with pytest.raises(Exception, match="Conversion failed"):
                 service.export_to_pdf("test.pdf", sample_analysis_data)
-
-
-if __name__ == "__main__":
-    pytest.main([__file__, "-v"])
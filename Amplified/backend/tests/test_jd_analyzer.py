@@ -4,16 +4,25 @@ Validates job description parsing and analysis functionality
 """
 
 import pytest
-from unittest.mock import AsyncMock, MagicMock
-from app.services.jd_analyzer import JDAnalyzer
+from unittest.mock import AsyncMock
+
+# Structure JDAnalyzer.analyze_jd returns when the LLM call fails
+FALLBACK_RESPONSE = {
+    "company_name": "Unknown Company",
+    "role_title": "Unknown Role",
+    "key_responsibilities": [],
+    "required_skills": [],
+    "summary": "Could not analyze job description."
+}
 
 
 class TestJDAnalyzer:
     """Test suite for JDAnalyzer"""
     
-    @pytest.fixture
+    @pytest.fixture(scope="session")
     def analyzer(self):
-        """Create a JDAnalyzer instance"""
+        """Create a JDAnalyzer instance (stateless, shared across tests)"""
+        from app.services.jd_analyzer import JDAnalyzer
         return JDAnalyzer()
     
     @pytest.mark.asyncio
@@ -58,13 +67,7 @@ class TestJDAnalyzer:
         jd_text = ""
         
         mock_llm_service = AsyncMock()
-        mock_llm_service.generate_json = AsyncMock(return_value={
-            "company_name": "Unknown Company",
-            "role_title": "Unknown Role",
-            "key_responsibilities": [],
-            "required_skills": [],
-            "summary": "Could not analyze job description."
-        })
+        mock_llm_service.generate_json = AsyncMock(return_value=FALLBACK_RESPONSE)
         
         result = await analyzer.analyze_jd(jd_text, mock_llm_service)
         
@@ -102,9 +105,7 @@ class TestJDAnalyzer:
         # Should not raise, but return fallback structure
         result = await analyzer.analyze_jd(jd_text, mock_llm_service)
         
-        assert isinstance(result, dict)
-        assert result["role_title"] == "Unknown Role"
-        assert result["company_name"] == "Unknown Company"
+        assert result == FALLBACK_RESPONSE
 
 
 if __name__ == "__main__":
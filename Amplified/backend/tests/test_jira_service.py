@@ -4,16 +4,19 @@ Validates Jira integration, ticket fetching, and data parsing
 """
 
 import pytest
-from unittest.mock import AsyncMock, patch, MagicMock
-from app.services.jira_service import JiraService
+import respx
+from unittest.mock import patch, MagicMock
 from app.models import JiraSettings
 
+JIRA_BASE_URL = "https://test.atlassian.net"
+
 class TestJiraService:
     """Test suite for JiraService"""
     
-    @pytest.fixture
+    @pytest.fixture(scope="session")
     def service(self):
-        """Create a JiraService instance"""
+        """Create a JiraService instance (stateless, shared across tests)"""
+        from app.services.jira_service import JiraService
         return JiraService()
     
     @pytest.fixture
@@ -21,11 +24,32 @@ class TestJiraService:
         """Create mock JiraSettings"""
         return JiraSettings(
             user_id="default",
-            base_url="https://test.atlassian.net",
+            base_url=JIRA_BASE_URL,
             email="test@example.com",
             api_token_encrypted="encrypted_token"
         )
 
+    @pytest.fixture
+    def configured(self, service, mock_settings, monkeypatch):
+        """Give the service stored settings and a decryptable API token"""
+        monkeypatch.setattr(service, "get_settings", lambda *args, **kwargs: mock_settings)
+        monkeypatch.setattr(service.encryption_service, "decrypt", lambda *args, **kwargs: "token")
+
+    @pytest.fixture
+    def session_mock(self, monkeypatch):
+        """Stand in for the service's DB session and select() in one place"""
+        session = MagicMock()
+        session.__enter__.return_value = session
+        monkeypatch.setattr("app.services.jira_service.Session", lambda *args, **kwargs: session)
+        monkeypatch.setattr("app.services.jira_service.select", MagicMock())
+        return session
+
+    @pytest.fixture
+    def httpx_mock(self):
+        """Route httpx requests to respx handlers instead of the network"""
+        with respx.mock(assert_all_called=False) as mock:
+            yield mock
+
     # --- Ticket Key Extraction Tests ---
     
     def test_extract_ticket_key_direct(self, service):
@@ -33,85 +57,76 @@ class TestJiraService:
         assert service._extract_ticket_key("PROJ-123") == "PROJ-123"
         assert service._extract_ticket_key("  PROJ-123  ") == "PROJ-123"
 
-    def test_extract_ticket_key_url(self, service):
+    @pytest.mark.parametrize("url,expected", [
+        ("https://domain.atlassian.net/browse/PROJ-123", "PROJ-123"),
+        ("https://domain.atlassian.net/browse/PROJ-123/", "PROJ-123"),
+        ("https://domain.atlassian.net/jira/software/projects/PROJ/boards/1?selectedIssue=PROJ-123", "PROJ-123"),
+    ])
+    def test_extract_ticket_key_url(self, service, url, expected):
         """Test extracting key from various URLs"""
-        urls = [
-            ("https://domain.atlassian.net/browse/PROJ-123", "PROJ-123"),
-            ("https://domain.atlassian.net/browse/PROJ-123/", "PROJ-123"),
-            ("https://domain.atlassian.net/jira/software/projects/PROJ/boards/1?selectedIssue=PROJ-123", "PROJ-123"),
-        ]
-        for url, expected in urls:
-            assert service._extract_ticket_key(url) == expected
-
-    def test_extract_ticket_key_invalid(self, service):
+        assert service._extract_ticket_key(url) == expected
+
+    @pytest.mark.parametrize("inp", [
+        "INVALID",
+        "123-PROJ",
+        "https://domain.atlassian.net/browse/",
+        ""
+    ])
+    def test_extract_ticket_key_invalid(self, service, inp):
         """Test invalid ticket keys raise error"""
-        invalid_inputs = [
-            "INVALID",
-            "123-PROJ",
-            "https://domain.atlassian.net/browse/",
-            ""
-        ]
-        for inp in invalid_inputs:
-            with pytest.raises(ValueError):
-                service._extract_ticket_key(inp)
+        with pytest.raises(ValueError):
+            service._extract_ticket_key(inp)
 
     # --- ADF Parsing Tests ---
 
-    def test_parse_adf_simple_text(self, service):
-        """Test parsing simple text ADF"""
-        assert service._parse_adf("Simple text") == "Simple text"
-        assert service._parse_adf(None) == ""
-
-    def test_parse_adf_complex(self, service):
-        """Test parsing complex ADF structure"""
-        adf = {
-            "type": "doc",
-            "content": [
-                {
-                    "type": "paragraph",
-                    "content": [
-                        {"type": "text", "text": "Hello "},
-                        {"type": "text", "text": "World"}
-                    ]
-                },
-                {
-                    "type": "paragraph",
-                    "content": [
-                        {"type": "text", "text": "Line 2"}
-                    ]
-                }
-            ]
-        }
-        # Expect "Hello World\nLine 2" (trimmed)
-        result = service._parse_adf(adf)
-        assert "Hello World" in result
-        assert "Line 2" in result
+    @pytest.mark.parametrize("adf,expected", [
+        ("Simple text", "Simple text"),
+        (None, ""),
+        (
+            {
+                "type": "doc",
+                "content": [
+                    {
+                        "type": "paragraph",
+                        "content": [
+                            {"type": "text", "text": "Hello "},
+                            {"type": "text", "text": "World"}
+                        ]
+                    },
+                    {
+                        "type": "paragraph",
+                        "content": [
+                            {"type": "text", "text": "Line 2"}
+                        ]
+                    }
+                ]
+            },
+            "Hello World\nLine 2"
+        ),
+    ], ids=["plain_string", "none", "paragraphs"])
+    def test_parse_adf(self, service, adf, expected):
+        """Test parsing plain and structured ADF bodies"""
+        assert service._parse_adf(adf) == expected
 
     # --- API Interaction Tests ---
 
     @pytest.mark.asyncio
-    async def test_validate_connection_success(self, service, mock_settings):
+    @pytest.mark.usefixtures("configured")
+    async def test_validate_connection_success(self, service, httpx_mock):
         """Test successful connection validation"""
-        with patch.object(service, 'get_settings', return_value=mock_settings), \
-             patch.object(service.encryption_service, 'decrypt', return_value="token"), \
-             patch("httpx.AsyncClient.get", new_callable=AsyncMock) as mock_get:
-            
-            mock_get.return_value.status_code = 200
-            
-            result = await service.validate_connection("default")
-            assert result is True
+        httpx_mock.get(f"{JIRA_BASE_URL}/rest/api/3/myself").respond(200)
+        
+        result = await service.validate_connection("default")
+        assert result is True
 
     @pytest.mark.asyncio
-    async def test_validate_connection_failure(self, service, mock_settings):
+    @pytest.mark.usefixtures("configured")
+    async def test_validate_connection_failure(self, service, httpx_mock):
         """Test failed connection validation"""
-        with patch.object(service, 'get_settings', return_value=mock_settings), \
-             patch.object(service.encryption_service, 'decrypt', return_value="token"), \
-             patch("httpx.AsyncClient.get", new_callable=AsyncMock) as mock_get:
-            
-            mock_get.return_value.status_code = 401
-            
-            result = await service.validate_connection("default")
-            assert result is False
+        httpx_mock.get(f"{JIRA_BASE_URL}/rest/api/3/myself").respond(401)
+        
+        result = await service.validate_connection("default")
+        assert result is False
 
     @pytest.mark.asyncio
     async def test_validate_connection_no_settings(self, service):
@@ -121,7 +136,8 @@ class TestJiraService:
             assert result is False
 
     @pytest.mark.asyncio
-    async def test_fetch_ticket_success(self, service, mock_settings):
+    @pytest.mark.usefixtures("configured")
+    async def test_fetch_ticket_success(self, service, httpx_mock):
         """Test successful ticket fetching"""
         mock_response_data = {
             "key": "PROJ-123",
@@ -132,47 +148,32 @@ class TestJiraService:
                 "priority": {"name": "High"}
             }
         }
-
-        with patch.object(service, 'get_settings', return_value=mock_settings), \
-             patch.object(service.encryption_service, 'decrypt', return_value="token"), \
-             patch("httpx.AsyncClient.get", new_callable=AsyncMock) as mock_get:
-            
-            # Configure the mock response
-            mock_response = MagicMock()
-            mock_response.status_code = 200
-            mock_response.json.return_value = mock_response_data
-            mock_get.return_value = mock_response
-            
-            result = await service.fetch_ticket("PROJ-123")
-            
-            assert result["key"] == "PROJ-123"
-            assert result["summary"] == "Test Ticket"
-            assert result["status"] == "In Progress"
-            assert result["priority"] == "High"
+        httpx_mock.get(f"{JIRA_BASE_URL}/rest/api/3/issue/PROJ-123").respond(200, json=mock_response_data)
+        
+        result = await service.fetch_ticket("PROJ-123")
+        
+        assert result["key"] == "PROJ-123"
+        assert result["summary"] == "Test Ticket"
+        assert result["status"] == "In Progress"
+        assert result["priority"] == "High"
 
     @pytest.mark.asyncio
-    async def test_fetch_ticket_not_found(self, service, mock_settings):
+    @pytest.mark.usefixtures("configured")
+    async def test_fetch_ticket_not_found(self, service, httpx_mock):
         """Test fetching non-existent ticket"""
-        with patch.object(service, 'get_settings', return_value=mock_settings), \
-             patch.object(service.encryption_service, 'decrypt', return_value="token"), \
-             patch("httpx.AsyncClient.get", new_callable=AsyncMock) as mock_get:
-            
-            mock_get.return_value.status_code = 404
-            
-            with pytest.raises(ValueError, match="Ticket 'PROJ-123' not found"):
-                await service.fetch_ticket("PROJ-123")
+        httpx_mock.get(f"{JIRA_BASE_URL}/rest/api/3/issue/PROJ-123").respond(404)
+        
+        with pytest.raises(ValueError, match="Ticket 'PROJ-123' not found"):
+            await service.fetch_ticket("PROJ-123")
 
     @pytest.mark.asyncio
-    async def test_fetch_ticket_auth_error(self, service, mock_settings):
+    @pytest.mark.usefixtures("configured")
+    async def test_fetch_ticket_auth_error(self, service, httpx_mock):
         """Test fetching with invalid credentials"""
-        with patch.object(service, 'get_settings', return_value=mock_settings), \
-             patch.object(service.encryption_service, 'decrypt', return_value="token"), \
-             patch("httpx.AsyncClient.get", new_callable=AsyncMock) as mock_get:
-            
-            mock_get.return_value.status_code = 401
-            
-            with pytest.raises(ValueError, match="Authentication failed"):
-                await service.fetch_ticket("PROJ-123")
+        httpx_mock.get(f"{JIRA_BASE_URL}/rest/api/3/issue/PROJ-123").respond(401)
+        
+        with pytest.raises(ValueError, match="Authentication failed"):
+            await service.fetch_ticket("PROJ-123")
 
     @pytest.mark.asyncio
     async def test_fetch_ticket_missing_settings(self, service):
@@ -183,35 +184,29 @@ class TestJiraService:
 
     # --- Database Interaction Tests ---
 
-    def test_save_settings_new(self, service):
+    def test_save_settings_new(self, service, session_mock):
         """Test saving new settings"""
-        with patch("app.services.jira_service.Session") as mock_session_cls, \
-             patch("app.services.jira_service.select") as mock_select:
-            
-            mock_session = mock_session_cls.return_value
-            mock_session.__enter__.return_value = mock_session
-            
-            # Mock no existing settings
-            mock_session.exec.return_value.first.return_value = None
-            
-            settings = service.save_settings(
-                base_url="https://new.atlassian.net",
-                email="new@example.com",
-                api_token="token123"
-            )
-            
-            # Verify add was called
-            mock_session.add.assert_called_once()
-            mock_session.commit.assert_called_once()
-            mock_session.refresh.assert_called_once()
-            
-            # Verify settings object
-            args = mock_session.add.call_args[0][0]
-            assert isinstance(args, JiraSettings)
-            assert args.base_url == "https://new.atlassian.net"
-            assert args.email == "new@example.com"
+        # Mock no existing settings
+        session_mock.exec.return_value.first.return_value = None
+        
+        settings = service.save_settings(
+            base_url="https://new.atlassian.net",
+            email="new@example.com",
+            api_token="token123"
+        )
+        
+        # Verify add was called
+        session_mock.add.assert_called_once()
+        session_mock.commit.assert_called_once()
+        session_mock.refresh.assert_called_once()
+        
+        # Verify settings object
+        args = session_mock.add.call_args[0][0]
+        assert isinstance(args, JiraSettings)
+        assert args.base_url == "https://new.atlassian.net"
+        assert args.email == "new@example.com"
 
-    def test_save_settings_update(self, service):
+    def test_save_settings_update(self, service, session_mock):
         """Test updating existing settings"""
         existing_settings = JiraSettings(
             user_id="default",
@@ -220,43 +215,30 @@ class TestJiraService:
             api_token_encrypted="old_token"
         )
         
-        with patch("app.services.jira_service.Session") as mock_session_cls, \
-             patch("app.services.jira_service.select") as mock_select:
-            
-            mock_session = mock_session_cls.return_value
-            mock_session.__enter__.return_value = mock_session
-            
-            # Mock existing settings
-            mock_session.exec.return_value.first.return_value = existing_settings
-            
-            settings = service.save_settings(
-                base_url="https://updated.atlassian.net",
-                email="updated@example.com",
-                api_token="new_token"
-            )
-            
-            # Verify update
-            assert existing_settings.base_url == "https://updated.atlassian.net"
-            assert existing_settings.email == "updated@example.com"
-            mock_session.commit.assert_called_once()
-            mock_session.refresh.assert_called_once()
+        # Mock existing settings
+        session_mock.exec.return_value.first.return_value = existing_settings
+        
+        settings = service.save_settings(
+            base_url="https://updated.atlassian.net",
+            email="updated@example.com",
+            api_token="new_token"
+        )
+        
+        # Verify update
+        assert existing_settings.base_url == "https://updated.atlassian.net"
+        assert existing_settings.email == "updated@example.com"
+        session_mock.commit.assert_called_once()
+        session_mock.refresh.assert_called_once()
 
-    def test_get_settings(self, service):
+    def test_get_settings(self, service, session_mock):
         """Test retrieving settings"""
         mock_settings = JiraSettings(user_id="default", email="test@example.com")
+        session_mock.exec.return_value.first.return_value = mock_settings
+        
+        result = service.get_settings("default")
         
-        with patch("app.services.jira_service.Session") as mock_session_cls, \
-             patch("app.services.jira_service.select") as mock_select:
-            
-            mock_session = mock_session_cls.return_value
-            mock_session.__enter__.return_value = mock_session
-            
-            mock_session.exec.return_value.first.return_value = mock_settings
-            
-            result = service.get_settings("default")
-            
-            assert result == mock_settings
-            mock_session.exec.assert_called_once()
+        assert result == mock_settings
+        session_mock.exec.assert_called_once()
 
 
 if __name__ == "__main__":
@@ -4,17 +4,16 @@ Validates routing logic, provider integration, and error handling
 """
 
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch, Mock
-import json
-from app.services.llm_router import LLMRouter
+from unittest.mock import AsyncMock, patch
+from types import SimpleNamespace as NS
 from app.models import UserLLMPreference
 
 class TestLLMRouter:
     """Test suite for LLMRouter"""
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def mock_env(self):
-        """Mock environment variables"""
+        """Mock environment variables (module scope so they don't leak into other test files)"""
         with patch.dict("os.environ", {
             "OPENAI_API_KEY": "sk-test",
             "ANTHROPIC_API_KEY": "sk-ant-test",
@@ -22,16 +21,31 @@ class TestLLMRouter:
         }):
             yield
 
-    @pytest.fixture
-    def router(self, mock_env):
-        """Create router instance with mocked clients"""
+    @pytest.fixture(scope="module")
+    def _router_shell(self, mock_env):
+        """Construct the router once with mocked clients, shared across the module"""
         with patch("app.services.llm_router.AsyncOpenAI") as mock_openai, \
              patch("app.services.llm_router.AsyncAnthropic", create=True) as mock_claude:
+            from app.services.llm_router import LLMRouter
             
             router = LLMRouter()
             router.openai_client = mock_openai.return_value
             router.claude_client = mock_claude.return_value
-            return router
+            yield router
+
+    @pytest.fixture
+    def router(self, _router_shell):
+        """Hand out the shared router with clean call history on its clients"""
+        _router_shell.openai_client.reset_mock()
+        _router_shell.claude_client.reset_mock()
+        return _router_shell
+
+    @pytest.fixture
+    def make_openai_response(self):
+        """Factory for plain OpenAI chat completion response stubs"""
+        def _make(content):
+            return NS(choices=[NS(message=NS(content=content))])
+        return _make
 
     @pytest.fixture
     def mock_session(self):
@@ -77,13 +91,10 @@ class TestLLMRouter:
     # --- Generation Tests ---
 
     @pytest.mark.asyncio
-    async def test_generate_completion_openai(self, router):
+    async def test_generate_completion_openai(self, router, make_openai_response):
         """Test completion with OpenAI"""
         with patch.object(router, "get_user_engine", return_value="openai_gpt4o"):
-            # Mock OpenAI response
-            mock_response = MagicMock()
-            mock_response.choices[0].message.content = "OpenAI Response"
-            router.openai_client.chat.completions.create = AsyncMock(return_value=mock_response)
+            router.openai_client.chat.completions.create = AsyncMock(return_value=make_openai_response("OpenAI Response"))
             
             response = await router.generate_completion("Test prompt", user_id="user1")
             
@@ -95,8 +106,7 @@ class TestLLMRouter:
         """Test completion with Claude"""
         with patch.object(router, "get_user_engine", return_value="claude_3_5_sonnet"):
             # Mock Claude response
-            mock_response = MagicMock()
-            mock_response.content = [MagicMock(text="Claude Response")]
+            mock_response = NS(content=[NS(text="Claude Response")])
             router.claude_client.messages.create = AsyncMock(return_value=mock_response)
             
             response = await router.generate_completion("Test prompt", user_id="user1")
@@ -125,12 +135,10 @@ class TestLLMRouter:
     # --- JSON Generation Tests ---
 
     @pytest.mark.asyncio
-    async def test_generate_json_openai(self, router):
+    async def test_generate_json_openai(self, router, make_openai_response):
         """Test JSON generation with OpenAI"""
         with patch.object(router, "get_user_engine", return_value="openai_gpt4o"):
-            mock_response = MagicMock()
-            mock_response.choices[0].message.content = '{"key": "value"}'
-            router.openai_client.chat.completions.create = AsyncMock(return_value=mock_response)
+            router.openai_client.chat.completions.create = AsyncMock(return_value=make_openai_response('{"key": "value"}'))
             
             result = await router.generate_json("Test prompt", user_id="user1")
             
@@ -144,8 +152,7 @@ class TestLLMRouter:
         """Test JSON generation with Claude"""
         with patch.object(router, "get_user_engine", return_value="claude_3_5_sonnet"):
             # Mock Claude returning JSON string (without opening brace as it is prefilled)
-            mock_response = MagicMock()
-            mock_response.content = [MagicMock(text='"key": "value"}')]
+            mock_response = NS(content=[NS(text='"key": "value"}')])
             router.claude_client.messages.create = AsyncMock(return_value=mock_response)
             
             result = await router.generate_json("Test prompt", user_id="user1")
@@ -2,6 +2,8 @@ import pytest
 from httpx import AsyncClient
 from datetime import datetime
 
+pytestmark = pytest.mark.integration
+
 @pytest.mark.asyncio
 async def test_create_meeting(auth_client: AsyncClient):
     """
@@ -1,12 +1,17 @@
 import pytest
 from httpx import AsyncClient
+from app.dependencies import document_service
 
 @pytest.mark.asyncio
-async def test_qa_meeting(auth_client: AsyncClient):
+async def test_qa_meeting(auth_client: AsyncClient, fake_llm, llm_responses, monkeypatch):
     """Test QA meeting endpoint"""
+    # Skip the vector store lookup (it would embed the query)
+    monkeypatch.setattr(document_service, "search_documents", lambda *args, **kwargs: [])
+    fake_llm.generate_json.return_value = llm_responses["qa_answer"]
     data = {
         "question": "What is the status?",
         "context_window_seconds": 30
     }
     response = await auth_client.post("/qa/meeting", json=data)
-    assert response.status_code in [200, 500]
+    assert response.status_code == 200
+    assert response.json() == llm_responses["qa_answer"]
@@ -1,3 +1,4 @@
+import asyncio
 import pytest
 from httpx import AsyncClient
 from unittest.mock import patch, MagicMock
@@ -43,19 +44,10 @@ async def test_fetch_ticket_mock(auth_client: AsyncClient):
         assert data["summary"] == "Test Ticket"
 
 @pytest.mark.asyncio
-async def test_generate_test_cases_mock(auth_client: AsyncClient):
+async def test_generate_test_cases_mock(auth_client: AsyncClient, llm_responses):
     """Test generating test cases with mocked LLM"""
     with patch("app.services.session_manager.session_manager.llm_service.generate_json") as mock_generate:
-        mock_generate.return_value = {
-            "test_cases": [
-                {
-                    "type": "positive",
-                    "title": "Test 1",
-                    "steps": ["Step 1"],
-                    "expected_result": "Success"
-                }
-            ]
-        }
+        mock_generate.return_value = llm_responses["test_cases"]
         
         ticket_data = {
             "key": "PROJ-123",
@@ -83,16 +75,17 @@ async def test_save_and_history(auth_client: AsyncClient):
     assert response.status_code == 200
     gen_id = response.json()["id"]
     
-    # 2. Get History
-    response = await auth_client.get("/test-gen/history")
-    assert response.status_code == 200
-    history = response.json()
+    # 2. Get History and 3. Get Specific Generation (both only need gen_id)
+    hist_resp, detail_resp = await asyncio.gather(
+        auth_client.get("/test-gen/history"),
+        auth_client.get(f"/test-gen/{gen_id}")
+    )
+    assert hist_resp.status_code == 200
+    history = hist_resp.json()
     assert len(history) > 0
     assert history[0]["id"] == gen_id
     
-    # 3. Get Specific Generation
-    response = await auth_client.get(f"/test-gen/{gen_id}")
-    assert response.status_code == 200
-    data = response.json()
+    assert detail_resp.status_code == 200
+    data = detail_resp.json()
     assert data["id"] == gen_id
     assert data["ticket_key"] == "PROJ-123"
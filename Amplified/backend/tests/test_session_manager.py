@@ -10,10 +10,16 @@ from app.services.session_manager import SessionManager
 class TestSessionManager:
     """Test suite for SessionManager"""
     
-    @pytest.fixture
-    def manager(self):
-        """Create a SessionManager instance"""
+    @pytest.fixture(scope="module")
+    def _manager(self):
+        """Create one SessionManager for the module; its services are built once"""
         return SessionManager()
+
+    @pytest.fixture
+    def manager(self, _manager):
+        """Hand out the shared manager, clearing its sessions after each test"""
+        yield _manager
+        _manager.active_sessions.clear()
     
     def test_create_session(self, manager):
         """Test creating a new session"""
@@ -1,31 +1,25 @@
 import pytest
 from httpx import AsyncClient
 import os
+from app.dependencies import voice_service
 
 @pytest.mark.asyncio
-async def test_enroll_voice(auth_client: AsyncClient, temp_audio_file: str):
+async def test_enroll_voice(auth_client: AsyncClient, temp_audio_file: str, tmp_path, monkeypatch):
     """
     Test voice enrollment with a dummy audio file.
     """
+    # Enrollment only stores the sample; keep it out of the working tree
+    monkeypatch.setattr(voice_service, "upload_dir", str(tmp_path))
+    
     with open(temp_audio_file, "rb") as f:
         files = {"audio": (os.path.basename(temp_audio_file), f, "audio/wav")}
         data = {"name": "Test User"}
         response = await auth_client.post("/voice-profile/enroll", files=files, data=data)
     
-    # Note: This might fail if the backend actually tries to process the audio with Deepgram/etc.
-    # and the dummy file is invalid or credentials are missing.
-    # We expect either 200 (mocked/success) or 500 (processing error).
-    # Ideally, we should mock the VoiceService, but for integration tests we check the response.
-    
-    if response.status_code == 200:
-        data = response.json()
-        assert "id" in data
-        assert data["name"] == "Test User"
-    else:
-        # If it fails due to external service dependency, we log it but don't fail the test suite
-        # if we haven't mocked the service.
-        # For this plan, we assume the environment might not have API keys.
-        assert response.status_code in [200, 500]
+    assert response.status_code == 200
+    data = response.json()
+    assert "id" in data
+    assert data["name"] == "Test User"
 
 @pytest.mark.asyncio
 async def test_get_voice_profile(auth_client: AsyncClient):